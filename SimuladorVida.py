@@ -1,15 +1,37 @@
 import pygame
-import random
+import argparse
+import multiprocessing
 import time
 import math
 from collections import deque
+from itertools import repeat
+from dataclasses import dataclass
+from functools import partial
+import numpy as np
+
+try:
+    from numba import njit, prange, set_num_threads
+except ImportError:
+    # Without Numba the kernels run as plain Python: correct, just slow
+    def njit(*args, **kwargs):
+        return args[0] if args and callable(args[0]) else (lambda fn: fn)
+    prange = range
+    def set_num_threads(n):
+        pass
 from pygame.math import Vector2
 
 # --- CONFIGURATION & CONSTANTS ---
 SCREEN_W, SCREEN_H = 1280, 720
 WORLD_W, WORLD_H = 2000, 2000  # The universe is larger than the screen
+WORLD_DIMS = np.array([WORLD_W, WORLD_H], dtype=np.float32)  # Toroidal wrap modulus
 FPS = 60
-CELL_SIZE = 120
+STATS_INTERVAL = 6       # Frames between HUD graph samples (~10 Hz at 60 FPS)
+CELL_SIZE = 120          # Must cover the largest DNA sense radius within _nearest's r
+GRID_NX = -(-WORLD_W // CELL_SIZE)
+GRID_NY = -(-WORLD_H // CELL_SIZE)
+N_CELLS = GRID_NX * GRID_NY
+GRID_REFRESH_INTERVAL = 4  # Frames between spatial grid rebuilds
+MORTON_INTERVAL = 32     # Frames between spatial re-sorts, a multiple of GRID_REFRESH_INTERVAL
 
 # Lotka-Volterra Tuning
 PREY_START = 100
@@ -19,6 +41,17 @@ PREY_METABOLISM = 0.5    # Energy lost per frame
 PRED_METABOLISM = 0.8    # Predators burn energy faster
 REPRO_COST_PREY = 100
 REPRO_COST_PRED = 250
+EAT_RADIUS_PREY = 10     # Distance at which food is eaten
+EAT_RADIUS_PRED = 12     # Catch radius
+MAX_ENERGY = 400
+PREY_ENERGY = 150        # Energy at birth
+PRED_ENERGY = 300
+
+# DNA: (speed, force, sense), stored as one row of Population.dna
+DNA_SPEED, DNA_FORCE, DNA_SENSE = 0, 1, 2
+PREY_DNA = (3.5, 0.5, 100)
+PRED_DNA = (4.2, 0.3, 180)
+POP_CAPACITY = 4096      # Preallocated rows per population, doubled when full
 
 # Colors (Neon Palette)
 C_BG = (8, 8, 14)
@@ -28,6 +61,8 @@ C_RED = (255, 40, 80)       # Predator
 C_GREEN = (100, 255, 120)   # Food
 C_WHITE = (220, 220, 220)
 C_HUD_BG = (15, 15, 20, 200)
+C_KEY = (255, 0, 255)       # Transparent colorkey of cached overlays
+GLOW_RADII = (1, 2, 3, 4, 5, 6, 8, 12, 16)  # Screen radii with a cached agent sprite
 
 # --- ENGINE UTILITIES ---
 
@@ -66,188 +101,502 @@ class Camera:
             self.offset.x = -(WORLD_W * self.zoom_level - SCREEN_W) / 2
             self.offset.y = -(WORLD_H * self.zoom_level - SCREEN_H) / 2
 
-    def apply(self, pos):
-        """Convert World Pos -> Screen Pos"""
-        return (pos * self.zoom_level) + self.offset
+    def project(self, pos_xy):
+        """Convert an (N, 2) array of World Pos -> Screen Pos"""
+        return pos_xy * self.zoom_level + (self.offset.x, self.offset.y)
+
+    def project_visible(self, pos_xy, r):
+        """Screen Pos of the rows whose r-pixel footprint overlaps the screen (culling)"""
+        sp = self.project(pos_xy)
+        vis = ((sp[:, 0] >= -r) & (sp[:, 0] < SCREEN_W + r) &
+               (sp[:, 1] >= -r) & (sp[:, 1] < SCREEN_H + r))
+        return sp[vis]
 
     def unapply(self, screen_pos):
         """Convert Screen Pos -> World Pos (for mouse clicks)"""
         return (Vector2(screen_pos) - self.offset) / self.zoom_level
 
-class SpatialGrid:
+def make_glow_sprite(color, r):
+    """Agent sprite of screen radius r: translucent glow halo plus solid core."""
+    s = pygame.Surface((r*4, r*4), pygame.SRCALPHA)
+    pygame.draw.circle(s, (*color, 50), (r*2, r*2), int(r*1.5))
+    pygame.draw.circle(s, color, (r*2, r*2), r)
+    return s
+
+def make_dot_sprite(color, r):
+    s = pygame.Surface((r*2, r*2), pygame.SRCALPHA)
+    pygame.draw.circle(s, color, (r, r), r)
+    return s
+
+def draw_world_lines(surface, zoom, origin):
+    """World border and spatial grid cell lines, scaled by zoom, with (0, 0) at origin."""
+    ox, oy = origin
+    w, h = WORLD_W * zoom, WORLD_H * zoom
+    for x in range(CELL_SIZE, WORLD_W, CELL_SIZE):
+        pygame.draw.line(surface, C_GRID, (ox + x * zoom, oy), (ox + x * zoom, oy + h))
+    for y in range(CELL_SIZE, WORLD_H, CELL_SIZE):
+        pygame.draw.line(surface, C_GRID, (ox, oy + y * zoom), (ox + w, oy + y * zoom))
+    pygame.draw.rect(surface, C_GRID, (ox, oy, w, h), 2)
+
+def cell_coords(pos_xy):
+    """Integer grid cell (cx, cy) of every row, clamped to the world."""
+    cx = np.clip((pos_xy[:, 0] // CELL_SIZE).astype(np.int32), 0, GRID_NX - 1)
+    cy = np.clip((pos_xy[:, 1] // CELL_SIZE).astype(np.int32), 0, GRID_NY - 1)
+    return cx, cy
+
+def _spread_bits(x):
+    # Insert a zero bit between each of the low 16 bits of x
+    x = (x | (x << 8)) & 0x00FF00FF
+    x = (x | (x << 4)) & 0x0F0F0F0F
+    x = (x | (x << 2)) & 0x33333333
+    x = (x | (x << 1)) & 0x55555555
+    return x
+
+def morton_order(pos_xy):
+    """Permutation visiting rows in Z-order of their grid cell."""
+    cx, cy = cell_coords(pos_xy)
+    return np.argsort(_spread_bits(cx) | (_spread_bits(cy) << 1), kind='stable')
+
+class FlatGrid:
+    """Counting-sort cell index over a position column.
+
+    Row indices are sorted by cell id (cx * GRID_NY + cy) into `order`, and
+    `starts[c]:starts[c+1]` is the slice of `order` living in cell c. The
+    world is bounded, so the id is a dense, collision-free int: no hashing,
+    and the cells of one grid column are a single contiguous slice.
+    Queries are done inside the kernels (see `_nearest`).
+    """
     def __init__(self):
-        self.cells = {}
-    
-    def clear(self):
-        self.cells = {}
-
-    def add(self, obj):
-        idx = (int(obj.pos.x // CELL_SIZE), int(obj.pos.y // CELL_SIZE))
-        if idx not in self.cells: self.cells[idx] = []
-        self.cells[idx].append(obj)
-
-    def get_nearby(self, pos, r=1):
-        found = []
-        cx, cy = int(pos.x // CELL_SIZE), int(pos.y // CELL_SIZE)
-        for x in range(cx - r, cx + r + 1):
-            for y in range(cy - r, cy + r + 1):
-                if (x, y) in self.cells:
-                    found.extend(self.cells[(x, y)])
-        return found
+        self.order = np.zeros(0, dtype=np.intp)
+        self.starts = np.zeros(N_CELLS + 1, dtype=np.intp)
 
-# --- ENTITIES ---
+    def build(self, pos_xy):
+        cx, cy = cell_coords(pos_xy)
+        cid = cx * GRID_NY + cy
+        self.order = np.argsort(cid, kind='stable')
+        self.starts[1:] = np.bincount(cid, minlength=N_CELLS).cumsum()
 
-class Entity:
-    def __init__(self, x, y):
-        self.pos = Vector2(x, y)
-        self.active = True
-
-class Food(Entity):
-    def draw(self, surface, camera):
-        screen_pos = camera.apply(self.pos)
-        size = 3 * camera.zoom_level
-        pygame.draw.circle(surface, C_GREEN, (int(screen_pos.x), int(screen_pos.y)), int(max(1, size)))
-
-class Agent(Entity):
-    def __init__(self, x, y, dna):
-        super().__init__(x, y)
-        self.vel = Vector2(random.uniform(-1, 1), random.uniform(-1, 1))
-        self.acc = Vector2(0, 0)
-        self.dna = dna # speed, force, sense
-        self.energy = 150
-        self.max_energy = 400
-        self.radius = 5
-        self.color = C_WHITE
-        self.wander_theta = random.uniform(0, 100)
-
-    def edges(self):
-        # Toroidal wrap (Pacman style)
-        if self.pos.x > WORLD_W: self.pos.x = 0
-        if self.pos.x < 0: self.pos.x = WORLD_W
-        if self.pos.y > WORLD_H: self.pos.y = 0
-        if self.pos.y < 0: self.pos.y = WORLD_H
+# --- ENTITIES ---
+# Entities are stored as structure-of-arrays: one preallocated ndarray column
+# per attribute, rows [0, count) are live. Deaths compact the columns in place.
+
+class ColumnStore:
+    COLUMNS = ()
+
+    def __len__(self):
+        """Number of active entities; rows retired since the last compact() don't count."""
+        return int(np.count_nonzero(self.active[:self.count]))
+
+    def active_rows(self, name):
+        return getattr(self, name)[:self.count][self.active[:self.count]]
+
+    def _grow(self):
+        # Double every column; rows past count are scratch, whatever np.resize fills in
+        self.capacity *= 2
+        for name in self.COLUMNS:
+            col = getattr(self, name)
+            setattr(self, name, np.resize(col, (self.capacity, *col.shape[1:])))
+
+    def live(self, *names):
+        """Views of the live rows of the given columns."""
+        return tuple(getattr(self, name)[:self.count] for name in names)
+
+    def permute(self, perm):
+        """Reorder the live rows so that new row k is old row perm[k]."""
+        for name in self.COLUMNS:
+            col = getattr(self, name)
+            col[:self.count] = col[:self.count][perm]
+
+    def compact(self, keep):
+        """Drop live rows where `keep` is False, preserving order."""
+        n = int(np.count_nonzero(keep))
+        for name in self.COLUMNS:
+            col = getattr(self, name)
+            col[:n] = col[:self.count][keep]
+        self.count = n
+
+@dataclass
+class Food(ColumnStore):
+    capacity: int = 1024
+    count: int = 0
+
+    COLUMNS = ('pos', 'active')
+
+    def __post_init__(self):
+        self.pos = np.zeros((self.capacity, 2), dtype=np.float32)
+        self.active = np.zeros(self.capacity, dtype=bool)
+
+    def append_one(self, x, y):
+        if self.count == self.capacity: self._grow()
+        self.pos[self.count] = x, y
+        self.active[self.count] = True
+        self.count += 1
+
+    def append_batch(self, pos):
+        k = len(pos)
+        while self.count + k > self.capacity: self._grow()
+        self.pos[self.count:self.count + k] = pos
+        self.active[self.count:self.count + k] = True
+        self.count += k
+
+@dataclass
+class Population(ColumnStore):
+    capacity: int = POP_CAPACITY
+    count: int = 0
+
+    COLUMNS = ('pos', 'vel', 'acc', 'energy', 'dna', 'wander_theta', 'active')
+
+    def __post_init__(self):
+        n = self.capacity
+        self.pos = np.zeros((n, 2), dtype=np.float32)
+        self.vel = np.zeros((n, 2), dtype=np.float32)
+        self.acc = np.zeros((n, 2), dtype=np.float32)
+        self.energy = np.zeros(n, dtype=np.float32)
+        self.dna = np.zeros((n, 3), dtype=np.float32)
+        self.wander_theta = np.zeros(n, dtype=np.float32)
+        self.active = np.zeros(n, dtype=bool)
+
+    def append_one(self, x, y, dna, energy, rng):
+        """Write one agent into the next free row; capacity doubles when full."""
+        if self.count == self.capacity: self._grow()
+        i = self.count
+        self.pos[i] = x, y
+        self.vel[i] = rng.uniform(-1, 1, 2)
+        self.acc[i] = 0
+        self.energy[i] = energy
+        self.dna[i] = dna
+        self.wander_theta[i] = rng.uniform(0, 100)
+        self.active[i] = True
+        self.count += 1
+
+    def append_batch(self, pos, dna, energy, rng):
+        """Append len(pos) agents with fresh random velocity and wander phase."""
+        k = len(pos)
+        while self.count + k > self.capacity: self._grow()
+        rows = slice(self.count, self.count + k)
+        self.pos[rows] = pos
+        self.vel[rows] = rng.uniform(-1, 1, (k, 2))
+        self.acc[rows] = 0
+        self.energy[rows] = energy
+        self.dna[rows] = dna
+        self.wander_theta[rows] = rng.uniform(0, 100, k)
+        self.active[rows] = True
+        self.count += k
+
+    def metabolize(self, rate):
+        # Lotka-Volterra: Energy Decay, faster agents burn more
+        vel = self.vel[:self.count]
+        self.energy[:self.count] -= rate + np.einsum('ij,ij->i', vel, vel) * 0.01
+
+    def reproduce(self, cost, child_energy, rng):
+        """Every agent above cost + 50 energy pays `cost` for one mutated child at its position."""
+        births = np.nonzero(self.active[:self.count] & (self.energy[:self.count] > cost + 50))[0]
+        self.energy[births] -= cost
+        # Mutation
+        child_dna = self.dna[births] * uniform32(rng, 0.9, 1.1, (len(births), 3))
+        self.append_batch(self.pos[births], child_dna, child_energy, rng)
 
     def update_physics(self):
-        self.vel += self.acc
-        if self.vel.length() > self.dna['speed']:
-            self.vel.scale_to_length(self.dna['speed'])
-        self.pos += self.vel
-        self.acc *= 0
-        self.edges()
-
-    def steer(self, target, mult=1.0):
-        desired = target - self.pos
-        if desired.length() == 0: return Vector2(0,0)
-        desired.scale_to_length(self.dna['speed'])
-        steer = desired - self.vel
-        if steer.length() > self.dna['force']: steer.scale_to_length(self.dna['force'])
-        return steer * mult
-
-    def draw(self, surface, camera):
-        sp = camera.apply(self.pos)
-        r = self.radius * camera.zoom_level
-        
-        # Glow
-        s = pygame.Surface((int(r*4), int(r*4)), pygame.SRCALPHA)
-        pygame.draw.circle(s, (*self.color, 50), (int(r*2), int(r*2)), int(r*1.5))
-        surface.blit(s, (sp.x - r*2, sp.y - r*2))
-        
-        # Core
-        pygame.draw.circle(surface, self.color, (int(sp.x), int(sp.y)), int(max(1, r)))
-
-class Prey(Agent):
-    def __init__(self, x, y, dna=None):
-        dna = dna if dna else {'speed': 3.5, 'force': 0.5, 'sense': 100}
-        super().__init__(x, y, dna)
-        self.color = C_CYAN
-        self.radius = 5
-
-    def update(self, grid_food, grid_pred):
-        # Lotka-Volterra: Energy Decay
-        self.energy -= PREY_METABOLISM + (self.vel.length_squared() * 0.01)
-
-        neighbors_pred = grid_pred.get_nearby(self.pos)
-        neighbors_food = grid_food.get_nearby(self.pos)
-        
-        closest_pred = None
-        min_p_dist = self.dna['sense']
-        for p in neighbors_pred:
-            d = self.pos.distance_to(p.pos)
-            if d < min_p_dist:
-                min_p_dist = d
-                closest_pred = p
-
-        force = Vector2(0,0)
+        n = self.count
+        vel, max_speed = self.vel[:n], self.dna[:n, DNA_SPEED]
+        vel += self.acc[:n]
+        speed2 = np.einsum('ij,ij->i', vel, vel)
+        mask = speed2 > max_speed * max_speed
+        vel[mask] *= (max_speed[mask] / np.sqrt(speed2[mask]))[:, None]
+        self.pos[:n] += vel
+        self.acc[:n] = 0
+        # Toroidal wrap (Pacman style)
+        np.mod(self.pos[:n], WORLD_DIMS, out=self.pos[:n])
+
+# Columns handed to the steering kernels, in their argument order
+STEER_COLUMNS = ('pos', 'vel', 'acc', 'energy', 'dna', 'wander_theta', 'active')
+
+
+# --- BEHAVIOUR KERNELS ---
+# Steering runs over whole populations at once. Kernels only read the grids
+# and write acc/wander_theta of their own row; eating is resolved afterwards by
+# `feed` so parallel agents never race on the same food or prey.
+
+@njit(cache=True, fastmath=True)
+def _nearest(px, py, sense, r, pos, active, order, starts):
+    """Closest active row within `sense` of (px, py) as (index, dist^2); index -1 if none."""
+    best, best_d2 = -1, sense * sense
+    cx, cy = int(px // CELL_SIZE), int(py // CELL_SIZE)
+    y0, y1 = max(cy - r, 0), min(cy + r, GRID_NY - 1)
+    for x in range(max(cx - r, 0), min(cx + r, GRID_NX - 1) + 1):
+        for k in range(starts[x * GRID_NY + y0], starts[x * GRID_NY + y1 + 1]):
+            j = order[k]
+            if not active[j]: continue
+            dx, dy = pos[j, 0] - px, pos[j, 1] - py
+            d2 = dx * dx + dy * dy
+            if d2 < best_d2:
+                best, best_d2 = j, d2
+    return best, best_d2
+
+@njit(cache=True, fastmath=True)
+def _nearest_threat_or_food(px, py, sense, r, hungry,
+                            pred_pos, pred_active, pred_order, pred_starts,
+                            food_pos, food_active, food_order, food_starts):
+    """Fused prey scan: one sweep over the cell block visits predators and food.
+
+    Returns (predator, food, food dist^2). Food is only scanned while hungry and
+    no predator has been seen, and is meaningless once a predator is found.
+    """
+    sense2 = sense * sense
+    pred, food, food_d2 = -1, -1, sense2
+    cx, cy = int(px // CELL_SIZE), int(py // CELL_SIZE)
+    y0, y1 = max(cy - r, 0), min(cy + r, GRID_NY - 1)
+    for x in range(max(cx - r, 0), min(cx + r, GRID_NX - 1) + 1):
+        c0, c1 = x * GRID_NY + y0, x * GRID_NY + y1 + 1
+        for k in range(pred_starts[c0], pred_starts[c1]):
+            j = pred_order[k]
+            if not pred_active[j]: continue
+            dx, dy = pred_pos[j, 0] - px, pred_pos[j, 1] - py
+            d2 = dx * dx + dy * dy
+            if d2 < sense2:
+                sense2 = d2
+                pred = j
+        if pred >= 0 or not hungry: continue
+        for k in range(food_starts[c0], food_starts[c1]):
+            j = food_order[k]
+            if not food_active[j]: continue
+            dx, dy = food_pos[j, 0] - px, food_pos[j, 1] - py
+            d2 = dx * dx + dy * dy
+            if d2 < food_d2:
+                food, food_d2 = j, d2
+    return pred, food, food_d2
+
+@njit(cache=True, fastmath=True)
+def _steer(px, py, vx, vy, tx, ty, speed, force, mult):
+    dx, dy = tx - px, ty - py
+    d2 = dx * dx + dy * dy
+    if d2 == 0.0: return 0.0, 0.0
+    inv = speed / math.sqrt(d2)
+    sx, sy = dx * inv - vx, dy * inv - vy
+    s2 = sx * sx + sy * sy
+    # Only pay for the second sqrt when the steer actually needs clamping
+    if s2 > force * force:
+        k = force / math.sqrt(s2)
+        sx, sy = sx * k, sy * k
+    return sx * mult, sy * mult
+
+# Explicit signatures pin every column to float32 so nothing is upcast
+_AGENT_SIG = ("float32[:, :], float32[:, :], float32[:, :], float32[:], float32[:, :], "
+              "float32[:], boolean[:]")
+_TARGET_SIG = "float32[:, :], boolean[:], intp[:], intp[:]"
+
+@njit(f"intp[:]({_AGENT_SIG}, {_TARGET_SIG}, {_TARGET_SIG}, intp, float32[:])",
+      parallel=True, cache=True, fastmath=True)
+def step_prey(pos, vel, acc, energy, dna, wander_theta, active,
+              food_pos, food_active, food_order, food_starts,
+              pred_pos, pred_active, pred_order, pred_starts, r, noise):
+    """Steer every prey; returns the food row each one reached this frame (-1 if none).
+
+    `noise` holds one pre-drawn wander increment per row.
+    """
+    eat = np.full(pos.shape[0], -1, dtype=np.intp)
+    for i in prange(pos.shape[0]):
+        if not active[i]: continue
+        px, py, vx, vy = pos[i, 0], pos[i, 1], vel[i, 0], vel[i, 1]
+        speed, force, sense = dna[i, DNA_SPEED], dna[i, DNA_FORCE], dna[i, DNA_SENSE]
+
+        fx, fy = 0.0, 0.0
+        pj, fj, f_d2 = _nearest_threat_or_food(px, py, sense, r, energy[i] < MAX_ENERGY,
+                                               pred_pos, pred_active, pred_order, pred_starts,
+                                               food_pos, food_active, food_order, food_starts)
 
         # 1. Flee Predator (High Priority)
-        if closest_pred:
-            force += self.steer(closest_pred.pos, -5.0)
+        if pj >= 0:
+            fx, fy = _steer(px, py, vx, vy, pred_pos[pj, 0], pred_pos[pj, 1], speed, force, -5.0)
 
         # 2. Eat Food (If safe)
-        elif self.energy < self.max_energy:
-            closest_food = None
-            min_f_dist = self.dna['sense']
-            for f in neighbors_food:
-                if not f.active: continue
-                d = self.pos.distance_to(f.pos)
-                if d < min_f_dist:
-                    min_f_dist = d
-                    closest_food = f
-            
-            if closest_food:
-                force += self.steer(closest_food.pos, 1.5)
-                if min_f_dist < 10:
-                    self.energy += 50
-                    closest_food.active = False
+        elif fj >= 0:
+            fx, fy = _steer(px, py, vx, vy, food_pos[fj, 0], food_pos[fj, 1], speed, force, 1.5)
+            if f_d2 < EAT_RADIUS_PREY * EAT_RADIUS_PREY:
+                eat[i] = fj
 
         # 3. Wander
-        if force.length() < 0.1:
+        if fx * fx + fy * fy < 0.01:
             # Perlin-ish wander
-            self.wander_theta += random.uniform(-0.3, 0.3)
-            circle = self.vel.normalize() * 30 if self.vel.length() > 0 else Vector2(1,0)
-            offset = Vector2(10, 0).rotate_rad(self.wander_theta)
-            force += self.steer(self.pos + circle + offset, 0.5)
-
-        self.acc += force
-        self.update_physics()
-
-class Predator(Agent):
-    def __init__(self, x, y, dna=None):
-        dna = dna if dna else {'speed': 4.2, 'force': 0.3, 'sense': 180}
-        super().__init__(x, y, dna)
-        self.color = C_RED
-        self.radius = 8
-        self.energy = 300
-
-    def update(self, grid_prey):
-        # Lotka-Volterra: Higher Decay for Predators
-        self.energy -= PRED_METABOLISM + (self.vel.length_squared() * 0.01)
-
-        neighbors = grid_prey.get_nearby(self.pos, r=2)
-        closest = None
-        min_dist = self.dna['sense']
-
-        for p in neighbors:
-            if not p.active: continue
-            d = self.pos.distance_to(p.pos)
-            if d < min_dist:
-                min_dist = d
-                closest = p
-        
-        force = Vector2(0,0)
-        
-        if closest:
-            force += self.steer(closest.pos, 1.2)
-            if min_dist < 12: # Catch radius
-                self.energy += 120 # Energy gain from eating
-                closest.active = False
+            wander_theta[i] += noise[i]
+            theta = wander_theta[i]
+            v = math.sqrt(vx * vx + vy * vy)
+            cx, cy = (vx / v * 30, vy / v * 30) if v > 0 else (1.0, 0.0)
+            tx, ty = px + cx + 10 * math.cos(theta), py + cy + 10 * math.sin(theta)
+            wx, wy = _steer(px, py, vx, vy, tx, ty, speed, force, 0.5)
+            fx += wx
+            fy += wy
+
+        acc[i, 0] += fx
+        acc[i, 1] += fy
+    return eat
+
+@njit(f"intp[:]({_AGENT_SIG}, {_TARGET_SIG}, intp, float32[:])",
+      parallel=True, cache=True, fastmath=True)
+def step_predator(pos, vel, acc, energy, dna, wander_theta, active,
+                  prey_pos, prey_active, prey_order, prey_starts, r, noise):
+    """Steer every predator; returns the prey row each one caught this frame (-1 if none)."""
+    catch = np.full(pos.shape[0], -1, dtype=np.intp)
+    for i in prange(pos.shape[0]):
+        if not active[i]: continue
+        px, py, vx, vy = pos[i, 0], pos[i, 1], vel[i, 0], vel[i, 1]
+
+        j, d2 = _nearest(px, py, dna[i, DNA_SENSE], r, prey_pos, prey_active, prey_order, prey_starts)
+        if j >= 0:
+            fx, fy = _steer(px, py, vx, vy, prey_pos[j, 0], prey_pos[j, 1],
+                            dna[i, DNA_SPEED], dna[i, DNA_FORCE], 1.2)
+            if d2 < EAT_RADIUS_PRED * EAT_RADIUS_PRED:
+                catch[i] = j
         else:
             # Efficient patrolling
-            self.wander_theta += random.uniform(-0.1, 0.1)
-            force += Vector2(1, 0).rotate_rad(self.wander_theta) * 0.5
+            wander_theta[i] += noise[i]
+            fx, fy = math.cos(wander_theta[i]) * 0.5, math.sin(wander_theta[i]) * 0.5
+
+        acc[i, 0] += fx
+        acc[i, 1] += fy
+    return catch
+
+def uniform32(rng, low, high, size):
+    """Like rng.uniform, but drawn directly as float32."""
+    return low + (high - low) * rng.random(size, dtype=np.float32)
+
+def feed(targets, energy, gain, target_active):
+    """Apply kernel eat/catch results: the lowest-index agent on each target gets it."""
+    eaters = np.nonzero(targets >= 0)[0]
+    eaten, first = np.unique(targets[eaters], return_index=True)
+    energy[eaters[first]] += gain
+    target_active[eaten] = False
+
+# --- SIMULATION ---
+
+# Tunables a headless run may override (see simulate_headless)
+DEFAULT_PARAMS = {
+    'prey_start': PREY_START,
+    'predator_start': PREDATOR_START,
+    'food_rate': FOOD_RATE,
+    'prey_metabolism': PREY_METABOLISM,
+    'pred_metabolism': PRED_METABOLISM,
+    'repro_cost_prey': REPRO_COST_PREY,
+    'repro_cost_pred': REPRO_COST_PRED,
+}
+
+class Ecosystem:
+    """Populations, grids and rules of one simulation; knows nothing about pygame."""
+    def __init__(self, seed=None, **params):
+        # A misspelt tunable would otherwise silently run with the default
+        unknown = params.keys() - DEFAULT_PARAMS.keys()
+        if unknown:
+            raise TypeError(f"Unknown simulation parameter(s): {', '.join(sorted(unknown))}")
+        self.params = {**DEFAULT_PARAMS, **params}
+        # Single source of randomness: runs with the same seed are identical
+        self.rng = np.random.default_rng(seed)
+        self.food = Food()
+        self.prey = Population()
+        self.preds = Population()
+        self.food.append_batch(self.random_positions(400))
+        self.prey.append_batch(self.random_positions(self.params['prey_start']),
+                               PREY_DNA, PREY_ENERGY, self.rng)
+        self.preds.append_batch(self.random_positions(self.params['predator_start']),
+                                PRED_DNA, PRED_ENERGY, self.rng)
+
+        self.grid_food = FlatGrid()
+        self.grid_prey = FlatGrid()
+        self.grid_preds = FlatGrid()
+        self.frame = 0
+
+        # Track max stats
+        self.max_prey = 0
+        self.max_pred = 0
+
+    def spawn_predator(self, x, y):
+        self.preds.append_one(x, y, PRED_DNA, PRED_ENERGY, self.rng)
+
+    def random_positions(self, n):
+        return self.rng.integers(0, (WORLD_W, WORLD_H), size=(n, 2), endpoint=True)
+
+    def step(self):
+        """Advance one frame. Returns False once both species are extinct."""
+        food, prey, preds, p = self.food, self.prey, self.preds, self.params
+
+        # 1. Entity Management (Death & Garbage Collection)
+        # Starved agents are retired at once, but rows are only compacted when
+        # the grids are rebuilt: between rebuilds the grids hold row indices.
+        prey.active[:prey.count] &= prey.energy[:prey.count] > 0
+        preds.active[:preds.count] &= preds.energy[:preds.count] > 0
+
+        # Check Fail State
+        if len(prey) == 0 and len(preds) == 0:
+            return False
+
+        # Agents move a few pixels per frame against CELL_SIZE, so the grids
+        # are rebuilt on an interval and stale frames search one extra ring
+        fresh = self.frame % GRID_REFRESH_INTERVAL == 0
+        if fresh:
+            for store in (food, prey, preds):
+                store.compact(store.active[:store.count])
+
+            # Keep rows in spatial (Morton) order so neighbours sit close in memory
+            if self.frame % MORTON_INTERVAL == 0:
+                for store in (food, prey, preds):
+                    store.permute(morton_order(store.pos[:store.count]))
+
+            self.grid_food.build(food.pos[:food.count])
+            self.grid_prey.build(prey.pos[:prey.count])
+            self.grid_preds.build(preds.pos[:preds.count])
+        reach = 0 if fresh else 1
+
+        # 2. Updates & Evolution
+
+        # Food Regrowth
+        if len(food) < 800 and self.rng.random() < p['food_rate']:
+            food.append_one(*self.random_positions(1)[0])
+
+        # Prey Logic
+        prey.metabolize(p['prey_metabolism'])
+        eat = step_prey(*prey.live(*STEER_COLUMNS),
+                        *food.live('pos', 'active'), self.grid_food.order, self.grid_food.starts,
+                        *preds.live('pos', 'active'), self.grid_preds.order, self.grid_preds.starts,
+                        1 + reach, uniform32(self.rng, -0.3, 0.3, prey.count))
+        feed(eat, prey.energy, 50, food.active)
+        prey.update_physics()
+        prey.reproduce(p['repro_cost_prey'], PREY_ENERGY, self.rng)
+
+        # Predator Logic (Higher Decay for Predators)
+        preds.metabolize(p['pred_metabolism'])
+        catch = step_predator(*preds.live(*STEER_COLUMNS),
+                              *prey.live('pos', 'active'), self.grid_prey.order, self.grid_prey.starts,
+                              2 + reach, uniform32(self.rng, -0.1, 0.1, preds.count))
+        feed(catch, preds.energy, 120, prey.active) # Energy gain from eating
+        preds.update_physics()
+        preds.reproduce(p['repro_cost_pred'], PRED_ENERGY, self.rng) # Requires more energy
 
-        self.acc += force
-        self.update_physics()
+        # Stats Update
+        self.max_prey = max(self.max_prey, len(prey))
+        self.max_pred = max(self.max_pred, len(preds))
+        self.frame += 1
+        return True
+
+def simulate_headless(seed, params=None, n_steps=20000):
+    """Run one simulation without a window and return its summary stats."""
+    sim = Ecosystem(seed, **(params or {}))
+    while sim.frame < n_steps and sim.step():
+        pass
+    return {
+        'seed': seed, 'frames': sim.frame,
+        'prey': len(sim.prey), 'preds': len(sim.preds),
+        'max_prey': sim.max_prey, 'max_pred': sim.max_pred,
+    }
+
+def _ensemble_worker_init():
+    # The pool already uses every core; keep each worker's kernels single-threaded
+    set_num_threads(1)
+
+def run_ensemble(seeds, params=None, n_steps=20000, processes=None):
+    """Run independent headless simulations, one per seed, across processes."""
+    run = partial(simulate_headless, params=params, n_steps=n_steps)
+    # spawn, not fork: a forked child can deadlock inside Numba's threading layer
+    with multiprocessing.get_context("spawn").Pool(processes, initializer=_ensemble_worker_init) as pool:
+        return pool.map(run, seeds)
 
 # --- MAIN APPLICATION ---
 
@@ -261,27 +610,29 @@ class SimulationApp:
         self.font_lg = pygame.font.SysFont("Arial Black", 50)
         self.font_md = pygame.font.SysFont("Consolas", 20)
         self.font_sm = pygame.font.SysFont("Consolas", 14)
+        self._text_cache = {}
         
         self.camera = Camera(SCREEN_W, SCREEN_H)
+        self.glow_cache = {(c, r): make_glow_sprite(c, r)
+                           for c in (C_CYAN, C_RED, C_WHITE) for r in GLOW_RADII}
+        self.food_sprites = {r: make_dot_sprite(C_GREEN, r) for r in (1, 2, 3)}
+        # HUD graph: x of each of the 200 history samples, relative to the graph
+        self._graph_x = np.linspace(0, 260, 200, endpoint=False)
+        # 2px taller than the grey plot so the stroke of a zero count (y=60) isn't clipped
+        self._graph_surf = pygame.Surface((260, 62))
+        self._graph_surf.set_colorkey(C_KEY)
+        # World overlay, one surface per settled (zoom * 100, overview_mode) tier
+        self._border_cache = {}
         self.running = True
         self.state = "INTRO" # INTRO, SIM, GAMEOVER
 
     def reset_sim(self):
-        self.food = [Food(random.randint(0, WORLD_W), random.randint(0, WORLD_H)) for _ in range(400)]
-        self.prey = [Prey(random.randint(0, WORLD_W), random.randint(0, WORLD_H)) for _ in range(PREY_START)]
-        self.preds = [Predator(random.randint(0, WORLD_W), random.randint(0, WORLD_H)) for _ in range(PREDATOR_START)]
-        
-        self.grid_food = SpatialGrid()
-        self.grid_prey = SpatialGrid()
-        self.grid_preds = SpatialGrid()
+        self.sim = Ecosystem()
         
         self.stats_history_prey = deque(maxlen=200)
         self.stats_history_pred = deque(maxlen=200)
+        self._graph_dirty = True
         self.start_time = time.time()
-        
-        # Track max stats
-        self.max_prey = 0
-        self.max_pred = 0
 
     # --- SCREENS ---
 
@@ -329,8 +680,8 @@ class SimulationApp:
         
         stats = [
             f"Simulation Duration: {duration} seconds",
-            f"Peak Prey Population: {self.max_prey}",
-            f"Peak Predator Population: {self.max_pred}",
+            f"Peak Prey Population: {self.sim.max_prey}",
+            f"Peak Predator Population: {self.sim.max_pred}",
             "",
             "Reason: Extinction event detected.",
             "",
@@ -366,83 +717,70 @@ class SimulationApp:
                 if event.button == 1: # Left Click
                     mx, my = pygame.mouse.get_pos()
                     world_pos = self.camera.unapply((mx, my))
-                    self.preds.append(Predator(world_pos.x, world_pos.y))
+                    self.sim.spawn_predator(world_pos.x, world_pos.y)
 
         self.camera.update()
 
-        # 2. Rebuild Spatial Grids
-        self.grid_food.clear(); self.grid_prey.clear(); self.grid_preds.clear()
-        
-        # 3. Entity Management (Death & Garbage Collection)
-        self.food = [f for f in self.food if f.active]
-        self.prey = [p for p in self.prey if p.active and p.energy > 0]
-        self.preds = [p for p in self.preds if p.active and p.energy > 0]
-        
-        # Check Fail State
-        if len(self.prey) == 0 and len(self.preds) == 0:
+        # 2. World Update
+        if not self.sim.step():
             self.state = "GAMEOVER"
             return
 
-        # Register to Grids
-        for f in self.food: self.grid_food.add(f)
-        for p in self.prey: self.grid_prey.add(p)
-        for p in self.preds: self.grid_preds.add(p)
-
-        # 4. Updates & Evolution
-        
-        # Food Regrowth
-        if len(self.food) < 800 and random.random() < FOOD_RATE:
-            self.food.append(Food(random.randint(0, WORLD_W), random.randint(0, WORLD_H)))
-
-        # Prey Logic
-        new_prey = []
-        for p in self.prey:
-            p.update(self.grid_food, self.grid_preds)
-            # Reproduction
-            if p.energy > REPRO_COST_PREY + 50:
-                p.energy -= REPRO_COST_PREY
-                # Mutation
-                new_dna = {k: v * random.uniform(0.9, 1.1) for k,v in p.dna.items()}
-                new_prey.append(Prey(p.pos.x, p.pos.y, new_dna))
-        self.prey.extend(new_prey)
-
-        # Predator Logic
-        new_preds = []
-        for p in self.preds:
-            p.update(self.grid_prey)
-            # Reproduction (Requires more energy)
-            if p.energy > REPRO_COST_PRED + 50:
-                p.energy -= REPRO_COST_PRED
-                new_dna = {k: v * random.uniform(0.9, 1.1) for k,v in p.dna.items()}
-                new_preds.append(Predator(p.pos.x, p.pos.y, new_dna))
-        self.preds.extend(new_preds)
-
         # Stats Update
-        self.max_prey = max(self.max_prey, len(self.prey))
-        self.max_pred = max(self.max_pred, len(self.preds))
-        if pygame.time.get_ticks() % 10 == 0:
-            self.stats_history_prey.append(len(self.prey))
-            self.stats_history_pred.append(len(self.preds))
+        if self.sim.frame % STATS_INTERVAL == 0:
+            self.stats_history_prey.append(len(self.sim.prey))
+            self.stats_history_pred.append(len(self.sim.preds))
+            self._graph_dirty = True
 
     def draw_sim(self):
         self.screen.fill(C_BG)
         
         # Draw World Boundaries if in God Mode
         if self.camera.overview_mode:
-            tl = self.camera.apply(Vector2(0,0))
-            br = self.camera.apply(Vector2(WORLD_W, WORLD_H))
-            pygame.draw.rect(self.screen, C_GRID, (tl.x, tl.y, br.x-tl.x, br.y-tl.y), 2)
+            self.draw_world_overlay()
         
         # Draw Entities
-        for f in self.food: f.draw(self.screen, self.camera)
-        for p in self.prey: p.draw(self.screen, self.camera)
-        for p in self.preds: p.draw(self.screen, self.camera)
+        self.draw_food()
+        self.draw_agents(self.sim.prey, C_CYAN, 5)
+        self.draw_agents(self.sim.preds, C_RED, 8)
         
         # Draw HUD
         self.draw_hud()
         
         pygame.display.flip()
 
+    def draw_world_overlay(self):
+        cam = self.camera
+        if abs(cam.zoom_level - cam.target_zoom) > 0.0005:
+            # Still zooming: every frame is a new scale, caching would not pay off
+            draw_world_lines(self.screen, cam.zoom_level, (cam.offset.x, cam.offset.y))
+            return
+        key = (int(cam.zoom_level * 100), cam.overview_mode)
+        overlay = self._border_cache.get(key)
+        if overlay is None:
+            w, h = int(WORLD_W * cam.zoom_level), int(WORLD_H * cam.zoom_level)
+            # Opaque + RLE colorkey: an SRCALPHA blit of this size costs more than redrawing
+            overlay = pygame.Surface((w + 1, h + 1)).convert()
+            overlay.fill(C_KEY)
+            draw_world_lines(overlay, cam.zoom_level, (0, 0))
+            overlay.set_colorkey(C_KEY, pygame.RLEACCEL)
+            if len(self._border_cache) >= 20:
+                del self._border_cache[next(iter(self._border_cache))] # Evict oldest
+            self._border_cache[key] = overlay
+        self.screen.blit(overlay, (cam.offset.x, cam.offset.y))
+
+    def draw_food(self):
+        r = int(max(1, 3 * self.camera.zoom_level))
+        tl = self.camera.project_visible(self.sim.food.active_rows('pos'), r) - r
+        self.screen.blits(zip(repeat(self.food_sprites[r]), tl.tolist()), doreturn=False)
+
+    def draw_agents(self, pop, color, radius):
+        # Snap to the closest pre-rendered size, one blit per agent
+        r = min(GLOW_RADII, key=lambda b: abs(b - radius * self.camera.zoom_level))
+        sprite = self.glow_cache[(color, r)]
+        tl = self.camera.project_visible(pop.active_rows('pos'), r*2) - r*2
+        self.screen.blits(zip(repeat(sprite), tl.tolist()), doreturn=False)
+
     def draw_hud(self):
         # Panel
         h = 150
@@ -452,35 +790,45 @@ class SimulationApp:
         
         # Text
         lines = [
-            f"PREY: {len(self.prey)}",
-            f"PREDATORS: {len(self.preds)}",
+            f"PREY: {len(self.sim.prey)}",
+            f"PREDATORS: {len(self.sim.preds)}",
             f"FPS: {int(self.clock.get_fps())}"
         ]
         for i, l in enumerate(lines):
             c = C_CYAN if "PREY" in l else C_RED if "PRED" in l else C_WHITE
-            self.screen.blit(self.font_sm.render(l, True, c), (20, 20 + i*18))
-            
-        # Graph (Lotka-Volterra Visualizer)
-        graph_rect = pygame.Rect(20, 80, 260, 60)
-        pygame.draw.rect(self.screen, (30, 30, 40), graph_rect)
-        
-        if len(self.stats_history_prey) > 2:
-            max_val = max(max(self.stats_history_prey), max(self.stats_history_pred), 1)
-            
-            def get_pts(data, color):
-                pts = []
-                for x, val in enumerate(data):
-                    px = 20 + (x / 200) * 260
-                    py = 140 - (val / max_val) * 60
-                    pts.append((px, py))
-                if len(pts) > 1: pygame.draw.lines(self.screen, color, False, pts, 2)
+            self.screen.blit(self.render_text(l, c), (20, 20 + i*18))
             
-            get_pts(self.stats_history_prey, C_CYAN)
-            get_pts(self.stats_history_pred, C_RED)
+        # Graph (Lotka-Volterra Visualizer), redrawn only when a sample is added
+        if self._graph_dirty:
+            self.draw_graph()
+        self.screen.blit(self._graph_surf, (20, 80))
 
         # Mode Indicator
         mode_txt = "VIEW: GOD MODE" if self.camera.overview_mode else "VIEW: FOCUSED"
-        self.screen.blit(self.font_sm.render(mode_txt, True, C_GREEN), (20, 155))
+        self.screen.blit(self.render_text(mode_txt, C_GREEN), (20, 155))
+
+    def render_text(self, txt, col):
+        """font_sm.render with a cache, HUD strings only change with the counts."""
+        key = (txt, col)
+        s = self._text_cache.get(key)
+        if s is None:
+            s = self.font_sm.render(txt, True, col)
+            if len(self._text_cache) >= 256:
+                del self._text_cache[next(iter(self._text_cache))] # Evict oldest
+            self._text_cache[key] = s
+        return s
+
+    def draw_graph(self):
+        self._graph_dirty = False
+        self._graph_surf.fill(C_KEY)
+        self._graph_surf.fill((30, 30, 40), (0, 0, 260, 60))
+        if len(self.stats_history_prey) > 2:
+            max_val = max(max(self.stats_history_prey), max(self.stats_history_pred), 1)
+            
+            for data, color in ((self.stats_history_prey, C_CYAN), (self.stats_history_pred, C_RED)):
+                py = 60 - np.asarray(data) / max_val * 60
+                pts = np.column_stack((self._graph_x[:len(data)], py)).tolist()
+                pygame.draw.lines(self._graph_surf, color, False, pts, 2)
 
     # --- MAIN LOOP ---
     
@@ -497,5 +845,16 @@ class SimulationApp:
         pygame.quit()
 
 if __name__ == "__main__":
-    app = SimulationApp()
-    app.run()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="BioSim: Lotka-Volterra Universe")
+    parser.add_argument("--ensemble", type=int, metavar="N",
+                        help="run N headless simulations in parallel and print their stats")
+    parser.add_argument("--steps", type=int, default=20000,
+                        help="frame limit of each headless simulation")
+    args = parser.parse_args()
+
+    if args.ensemble:
+        for stats in run_ensemble(range(args.ensemble), n_steps=args.steps):
+            print(stats)
+    else:
+        app = SimulationApp()
+        app.run()
\ No newline at end of file